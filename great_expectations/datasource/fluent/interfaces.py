@@ -24,6 +24,7 @@ from typing import (
     Protocol,
     Sequence,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -565,6 +566,8 @@ class Datasource(
     # Datasource sublcasses should update this set if the field should not be passed to the execution engine  # noqa: E501
     _EXTRA_EXCLUDED_EXEC_ENG_ARGS: ClassVar[Set[str]] = set()
     _type_lookup: ClassVar[TypeLookup]  # This attribute is set in `MetaDatasource.__new__`
+    # `asset_types` paired with their `type` name, this attribute is set in `MetaDatasource.__new__`
+    _resolved_asset_types: ClassVar[Tuple[Tuple[Type[DataAsset], str], ...]]
     # Setting this in a Datasource subclass will override the execution engine type.
     # The primary use case is to inject an execution engine for testing.
     execution_engine_override: ClassVar[Optional[Type[_ExecutionEngineT]]] = None  # type: ignore[misc]  # ClassVar cannot contain type variables
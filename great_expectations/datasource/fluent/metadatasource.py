@@ -28,25 +28,28 @@ class MetaDatasource(ModelMetaclass):
 
         Also binds asset adding methods according to the declared `asset_types`.
         """  # noqa: E501
-        logger.debug(f"1a. {meta_cls.__name__}.__new__() for `{cls_name}`")
+        logger.debug("1a. %s.__new__() for `%s`", meta_cls.__name__, cls_name)
 
         cls = super().__new__(meta_cls, cls_name, bases, cls_dict)
 
         if cls_name in ("Datasource", "InvalidDatasource") or cls_name.startswith("_"):
             # NOTE: the above check is brittle and must be kept in-line with the Datasource.__name__
-            logger.debug(f"1c. Skip factory registration of base `{cls_name}`")
+            logger.debug("1c. Skip factory registration of base `%s`", cls_name)
             return cls
 
-        logger.debug(f"  {cls_name} __dict__ ->\n{pf(cls.__dict__, depth=3)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  %s __dict__ ->\n%s", cls_name, pf(cls.__dict__, depth=3))
 
         meta_cls.__cls_set.add(cls)
-        logger.debug(f"Datasources: {len(meta_cls.__cls_set)}")
+        logger.debug("Datasources: %s", len(meta_cls.__cls_set))
 
         if cls.__module__ == "__main__":
             logger.warning(
-                f"Datasource `{cls_name}` should not be defined as part of __main__ this may cause typing lookup collisions"  # noqa: E501
+                "Datasource `%s` should not be defined as part of __main__ this may cause typing lookup collisions",  # noqa: E501
+                cls_name,
             )
         # instantiate new TypeLookup to prevent child classes conflicts with parent class asset types  # noqa: E501
         cls._type_lookup = TypeLookup()
+        cls._resolved_asset_types = _SourceFactories._resolve_asset_types(cls)
         _SourceFactories.register_datasource(cls)
         return cls
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import inspect
 from inspect import Parameter, Signature
-from typing import Callable, Type
+from typing import AbstractSet, Callable, Type, Union
 
 
 def _merge_signatures(
     target: Callable,
-    source: Callable,
-    exclude: set[str] | None = None,
+    source: Union[Callable, Signature],
+    exclude: AbstractSet[str] | None = None,
     return_type: Type | None = None,
 ) -> Signature:
     """
@@ -19,11 +19,13 @@ def _merge_signatures(
 
     The `source` signature cannot contain any positional arguments, and will be
     'appended' to the `target` signatures arguments.
+    An already computed `source` signature can be passed in to avoid re-inspecting `source`
+    when it is merged into several targets.
 
     Note: Signatures are immutable, a new signature is returned by this function.
     """
     target_sig: Signature = inspect.signature(target)
-    source_sig: Signature = inspect.signature(source)
+    source_sig: Signature = source if isinstance(source, Signature) else inspect.signature(source)
 
     final_exclude: set[str] = set()
 
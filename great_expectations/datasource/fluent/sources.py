@@ -2,24 +2,12 @@ from __future__ import annotations
 
 import inspect
 import logging
+import sys
 import uuid
 import warnings
+import weakref
 from enum import Enum
-from typing import (
-    TYPE_CHECKING,
-    Any,
-    Callable,
-    ClassVar,
-    Dict,
-    Generator,
-    List,
-    NamedTuple,
-    Optional,
-    Sequence,
-    Tuple,
-    Type,
-    Union,
-)
+from typing import TYPE_CHECKING
 
 from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility.typing_extensions import override
@@ -31,6 +19,21 @@ from great_expectations.datasource.fluent.signatures import _merge_signatures
 from great_expectations.datasource.fluent.type_lookup import TypeLookup
 
 if TYPE_CHECKING:
+    from typing import (
+        Any,
+        Callable,
+        ClassVar,
+        Dict,
+        Final,
+        Generator,
+        List,
+        Optional,
+        Sequence,
+        Tuple,
+        Type,
+        Union,
+    )
+
     from typing_extensions import TypeAlias
 
     from great_expectations.compatibility import pydantic
@@ -40,7 +43,8 @@ if TYPE_CHECKING:
     from great_expectations.datasource.fluent.interfaces import DataAsset, Datasource
     from great_expectations.validator.validator import Validator
 
-SourceFactoryFn: TypeAlias = Callable[..., "Datasource"]
+    SourceFactoryFn: TypeAlias = Callable[..., Datasource]
+    CrudMethodInfoFn: TypeAlias = Callable[..., Tuple["CrudMethodType", Type[Datasource]]]
 
 logger = logging.getLogger(__name__)
 
@@ -53,17 +57,26 @@ class TypeRegistrationError(TypeError):
     pass
 
 
-class _FieldDetails(NamedTuple):
-    default_value: Any
-    type_annotation: Type
+# memoized `_get_field_details()` results, entries are dropped along with the model class
+_FIELD_DETAILS_CACHE: weakref.WeakKeyDictionary[
+    Type[pydantic.BaseModel], Dict[str, Tuple[Any, Type]]
+] = weakref.WeakKeyDictionary()
 
 
-def _get_field_details(model: Type[pydantic.BaseModel], field_name: str) -> _FieldDetails:
+def _get_field_details(model: Type[pydantic.BaseModel], field_name: str) -> Tuple[Any, Type]:
     """Get the default value of the requested field and its type annotation."""
-    return _FieldDetails(
-        default_value=model.__fields__[field_name].default,
-        type_annotation=model.__fields__[field_name].type_,
-    )
+    cache = _FIELD_DETAILS_CACHE.setdefault(model, {})
+    field_details = cache.get(field_name)
+    if field_details is None:
+        field = model.__fields__[field_name]
+        field_details = (field.default, field.type_)
+        cache[field_name] = field_details
+    return field_details
+
+
+# parameters dropped from the `DataAsset` / `Datasource` signatures merged into the factory methods
+_MERGE_EXCLUDE_TYPE: Final[frozenset[str]] = frozenset({"type"})
+_MERGE_EXCLUDE_DATASOURCE: Final[frozenset[str]] = frozenset({"type", "assets"})
 
 
 class CrudMethodType(str, Enum):
@@ -73,7 +86,8 @@ class CrudMethodType(str, Enum):
     ADD_OR_UPDATE = "ADD_OR_UPDATE"
 
 
-CrudMethodInfoFn: TypeAlias = Callable[..., Tuple[CrudMethodType, Type["Datasource"]]]
+# registered crud method names -> the `crud_method_info` proxies they are built from
+_CRUD_REGISTRY: Dict[str, CrudMethodInfoFn] = {}
 
 
 class _SourceFactories:
@@ -84,13 +98,30 @@ class _SourceFactories:
     or `DataAsset` types and a simplified name for those types.
     """
 
+    __slots__ = ("_data_context", "_crud_method_cache")
+
     type_lookup: ClassVar = TypeLookup()
-    __crud_registry: ClassVar[Dict[str, CrudMethodInfoFn]] = {}
+    # materialized `_iter_all_registered_types()` entries, paired with the `type_names()` of the
+    # lookups they were built from
+    _all_types_cache: ClassVar[
+        Optional[
+            Tuple[
+                List[Tuple[str, ...]],
+                List[Tuple[str, Union[Type[Datasource], Type[DataAsset]], bool]],
+            ]
+        ]
+    ] = None
+    # registered crud method names, reset whenever a crud method is registered
+    _factories_cache: ClassVar[Optional[Tuple[str, ...]]] = None
 
     _data_context: GXDataContext
+    # crud methods already built for this instance, keyed by method name and paired with the
+    # `crud_method_info` they were built from so that re-registrations are picked up
+    _crud_method_cache: Dict[str, Tuple[CrudMethodInfoFn, Callable]]
 
     def __init__(self, data_context: GXDataContext):
         self._data_context = data_context
+        self._crud_method_cache = {}
 
     @classmethod
     def register_datasource(cls, ds_type: Type[Datasource]) -> None:
@@ -115,12 +146,20 @@ class _SourceFactories:
         """  # noqa: E501
 
         # TODO: check that the name is a valid python identifier (and maybe that it is snake_case?)
-        ds_type_name = _get_field_details(ds_type, "type").default_value
+        ds_type_name, _ = _get_field_details(ds_type, "type")
         if not ds_type_name:
             raise TypeRegistrationError(  # noqa: TRY003
                 f"`{ds_type.__name__}` is missing a `type` attribute with an assigned string value"
             )
 
+        # fail fast on re-registration (ex. module reloads) before any transaction is opened
+        if ds_type in cls.type_lookup:
+            raise TypeRegistrationError(  # noqa: TRY003
+                f"'{ds_type_name}' is already a registered typed and there can only be 1 type "
+                "for a given name."
+            )
+        cls.type_lookup.raise_if_contains((ds_type_name,))
+
         # rollback type registrations if exception occurs
         with cls.type_lookup.transaction() as ds_type_lookup, ds_type._type_lookup.transaction() as asset_type_lookup:  # noqa: E501
             cls._register_assets(ds_type, asset_type_lookup=asset_type_lookup)
@@ -142,13 +181,8 @@ class _SourceFactories:
         Register the `Datasource` class and add a factory method for the class on `sources`.
         The method name is pulled from the `Datasource.type` attribute.
         """
-        if ds_type in datasource_type_lookup:
-            raise TypeRegistrationError(  # noqa: TRY003
-                f"'{ds_type_name}' is already a registered typed and there can only be 1 type "
-                "for a given name."
-            )
         datasource_type_lookup[ds_type] = ds_type_name
-        logger.debug(f"'{ds_type_name}' added to `type_lookup`")
+        logger.debug("'%s' added to `type_lookup`", ds_type_name)
 
         cls._register_add_datasource(ds_type, ds_type_name)
         cls._register_update_datasource(ds_type, ds_type_name)
@@ -159,7 +193,7 @@ class _SourceFactories:
 
     @classmethod
     def _register_add_datasource(cls, ds_type: Type[Datasource], ds_type_name: str):
-        method_name = f"add_{ds_type_name}"
+        method_name = sys.intern(f"add_{ds_type_name}")
 
         def crud_method_info() -> tuple[CrudMethodType, Type[Datasource]]:
             return CrudMethodType.ADD, ds_type
@@ -168,7 +202,7 @@ class _SourceFactories:
 
     @classmethod
     def _register_update_datasource(cls, ds_type: Type[Datasource], ds_type_name: str):
-        method_name = f"update_{ds_type_name}"
+        method_name = sys.intern(f"update_{ds_type_name}")
 
         def crud_method_info() -> tuple[CrudMethodType, Type[Datasource]]:
             return CrudMethodType.UPDATE, ds_type
@@ -179,7 +213,7 @@ class _SourceFactories:
 
     @classmethod
     def _register_add_or_update_datasource(cls, ds_type: Type[Datasource], ds_type_name: str):
-        method_name = f"add_or_update_{ds_type_name}"
+        method_name = sys.intern(f"add_or_update_{ds_type_name}")
 
         def crud_method_info() -> tuple[CrudMethodType, Type[Datasource]]:
             return CrudMethodType.ADD_OR_UPDATE, ds_type
@@ -192,7 +226,7 @@ class _SourceFactories:
 
     @classmethod
     def _register_delete_datasource(cls, ds_type: Type[Datasource], ds_type_name: str):
-        method_name = f"delete_{ds_type_name}"
+        method_name = sys.intern(f"delete_{ds_type_name}")
 
         def crud_method_info() -> tuple[CrudMethodType, Type[Datasource]]:
             return CrudMethodType.DELETE, ds_type
@@ -213,59 +247,91 @@ class _SourceFactories:
         # generated methods.
         crud_method_info.__name__ = crud_fn_name
         crud_method_info.__doc__ = crud_fn_doc
-        if crud_fn_name in cls.__crud_registry:
+        if crud_fn_name in _CRUD_REGISTRY:
             raise TypeRegistrationError(  # noqa: TRY003
                 f"'`sources.{crud_fn_name}()` already exists",
             )
-        logger.debug(f"Registering data_context.source.{crud_fn_name}()")
+        logger.debug("Registering data_context.source.%s()", crud_fn_name)
         public_api(crud_method_info)
-        cls.__crud_registry[crud_fn_name] = crud_method_info
+        _CRUD_REGISTRY[crud_fn_name] = crud_method_info
+        cls._factories_cache = None
 
     @classmethod
-    def _register_assets(cls, ds_type: Type[Datasource], asset_type_lookup: TypeLookup):
+    def _resolve_asset_types(
+        cls, ds_type: Type[Datasource]
+    ) -> Tuple[Tuple[Type[DataAsset], str], ...]:
+        """
+        Pair each public `DataAsset` type declared in `ds_type.asset_types` with its `type` name.
+        Called once when the `Datasource` class is created, see `MetaDatasource.__new__`.
+        """
         asset_types: Sequence[Type[DataAsset]] = ds_type.asset_types
 
         if not asset_types:
             logger.warning(
-                f"No `{ds_type.__name__}.asset_types` have be declared for the `Datasource`"
+                "No `%s.asset_types` have be declared for the `Datasource`", ds_type.__name__
             )
 
+        resolved_asset_types: List[Tuple[Type[DataAsset], str]] = []
         for t in asset_types:
             if t.__name__.startswith("_"):
                 logger.debug(
-                    f"{t} is private, assuming not intended as a public concrete type. Skipping registration"  # noqa: E501
+                    "%s is private, assuming not intended as a public concrete type. Skipping registration",  # noqa: E501
+                    t,
                 )
                 continue
             try:
-                asset_type_name = _get_field_details(t, "type").default_value
+                asset_type_name, _ = _get_field_details(t, "type")
                 if asset_type_name is None:
                     raise TypeError(  # noqa: TRY003, TRY301
                         f"{t.__name__} `type` field must be assigned and cannot be `None`"
                     )
-                logger.debug(
-                    f"Registering `{ds_type.__name__}` `DataAsset` `{t.__name__}` as '{asset_type_name}'"  # noqa: E501
-                )
-                asset_type_lookup[t] = asset_type_name
             except (AttributeError, KeyError, TypeError) as bad_field_exc:
                 raise TypeRegistrationError(  # noqa: TRY003
                     f"No `type` field found for `{ds_type.__name__}.asset_types` -> `{t.__name__}` unable to register asset type",  # noqa: E501
                 ) from bad_field_exc
+            resolved_asset_types.append((t, asset_type_name))
+        return tuple(resolved_asset_types)
+
+    @classmethod
+    def _register_assets(cls, ds_type: Type[Datasource], asset_type_lookup: TypeLookup):
+        # factory methods are only bound once every asset type registered successfully
+        asset_factory_methods: Dict[str, Callable] = {}
+        for t, asset_type_name in ds_type._resolved_asset_types:
+            logger.debug(
+                "Registering `%s` `DataAsset` `%s` as '%s'",
+                ds_type.__name__,
+                t.__name__,
+                asset_type_name,
+            )
+            asset_type_lookup[t] = asset_type_name
+
+            asset_factory_methods.update(
+                cls._create_asset_factory_methods_if_not_present(ds_type, t, asset_type_name)
+            )
 
-            cls._bind_asset_factory_method_if_not_present(ds_type, t, asset_type_name)
+        for method_name, asset_factory_method in asset_factory_methods.items():
+            setattr(ds_type, method_name, asset_factory_method)
 
     @classmethod
-    def _bind_asset_factory_method_if_not_present(
+    def _create_asset_factory_methods_if_not_present(
         cls,
         ds_type: Type[Datasource],
         asset_type: Type[DataAsset],
         asset_type_name: str,
-    ):
-        add_asset_factory_method_name = f"add_{asset_type_name}_asset"
+    ) -> Dict[str, Callable]:
+        """
+        Create the `add_<asset_type_name>_asset()` and `read_<asset_type_name>()` factory methods
+        for `ds_type`, keyed by method name.
+        Nothing is created if an `add_<asset_type_name>_asset()` method is already defined.
+        """
+        add_asset_factory_method_name = sys.intern(f"add_{asset_type_name}_asset")
         asset_factory_defined: bool = hasattr(ds_type, add_asset_factory_method_name)
 
         if not asset_factory_defined:
             logger.debug(
-                f"No `{add_asset_factory_method_name}()` method found for `{ds_type.__name__}` generating the method..."  # noqa: E501
+                "No `%s()` method found for `%s` generating the method...",
+                add_asset_factory_method_name,
+                ds_type.__name__,
             )
 
             def _add_asset_factory(self: Datasource, name: str, **kwargs) -> pydantic.BaseModel:
@@ -274,7 +340,10 @@ class _SourceFactories:
                 # push them to `connect_options` field
                 if self.data_connector_type:
                     logger.info(
-                        f"'{self.name}' {type(self).__name__} uses {self.data_connector_type.__name__}"  # noqa: E501
+                        "'%s' %s uses %s",
+                        self.name,
+                        type(self).__name__,
+                        self.data_connector_type.__name__,
                     )
                     connect_options = {
                         k: v
@@ -283,7 +352,9 @@ class _SourceFactories:
                     }
                     if connect_options:
                         logger.info(
-                            f"{self.data_connector_type.__name__} connect_options provided -> {list(connect_options.keys())}"  # noqa: E501
+                            "%s connect_options provided -> %s",
+                            self.data_connector_type.__name__,
+                            list(connect_options.keys()),
                         )
                         for k in connect_options:  # TODO: avoid this extra loop
                             kwargs.pop(k)
@@ -296,17 +367,6 @@ class _SourceFactories:
                 asset = asset_type(name=name, **kwargs)
                 return self._add_asset(asset, connect_options=connect_options)
 
-            # attr-defined issue
-            # https://github.com/python/mypy/issues/12472
-            _add_asset_factory.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-                _add_asset_factory, asset_type, exclude={"type"}
-            )
-            _add_asset_factory.__name__ = add_asset_factory_method_name
-            setattr(ds_type, add_asset_factory_method_name, _add_asset_factory)
-
-            # add the public api decorator
-            public_api(getattr(ds_type, add_asset_factory_method_name))
-
             def _read_asset_factory(
                 self: Datasource, asset_name: str | None = None, **kwargs
             ) -> Validator:
@@ -317,16 +377,33 @@ class _SourceFactories:
                 # TODO: raise error if `_data_context` not set
                 return self._data_context.get_validator(batch_request=batch_request)  # type: ignore[union-attr] # self._data_context must be set
 
-            _read_asset_factory.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-                _read_asset_factory, asset_type, exclude={"type"}
+            # inspect the asset model once, it is merged into both the add and read factories
+            asset_type_signature = inspect.signature(asset_type)
+
+            # attr-defined issue
+            # https://github.com/python/mypy/issues/12472
+            _add_asset_factory.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
+                _add_asset_factory, asset_type_signature, exclude=_MERGE_EXCLUDE_TYPE
             )
-            read_asset_factory_method_name = f"read_{asset_type_name}"
-            setattr(ds_type, read_asset_factory_method_name, _read_asset_factory)
+            _add_asset_factory.__name__ = add_asset_factory_method_name
 
-        else:
-            logger.debug(
-                f"`{add_asset_factory_method_name}()` already defined `{ds_type.__name__}`"
+            # add the public api decorator
+            # NOTE: this must be applied at registration, not lazily on first call, the API docs
+            # build only includes methods whose docstring already carries the public api tag
+            public_api(_add_asset_factory)
+
+            _read_asset_factory.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
+                _read_asset_factory, asset_type_signature, exclude=_MERGE_EXCLUDE_TYPE
             )
+            read_asset_factory_method_name = sys.intern(f"read_{asset_type_name}")
+
+            return {
+                add_asset_factory_method_name: _add_asset_factory,
+                read_asset_factory_method_name: _read_asset_factory,
+            }
+
+        logger.debug("`%s()` already defined `%s`", add_asset_factory_method_name, ds_type.__name__)
+        return {}
 
     @property
     def pandas_default(self) -> PandasDatasource:
@@ -352,7 +429,13 @@ class _SourceFactories:
 
     @property
     def factories(self) -> List[str]:
-        return list(self.__crud_registry.keys())
+        return list(self._factory_names())
+
+    @classmethod
+    def _factory_names(cls) -> Tuple[str, ...]:
+        if cls._factories_cache is None:
+            cls._factories_cache = tuple(_CRUD_REGISTRY)
+        return cls._factories_cache
 
     def _validate_current_datasource_type(
         self, name: str, datasource_type: Type[Datasource], raise_if_none: bool = True
@@ -373,7 +456,7 @@ class _SourceFactories:
         self,
         datasource_type: Type[Datasource],
         name_or_datasource: Optional[Union[str, Datasource]],
-        **kwargs,
+        kwargs: Dict[str, Any],
     ) -> Optional[Datasource]:
         """Returns a datasource if one is passed in, otherwise None."""
         from great_expectations.datasource.fluent.interfaces import Datasource
@@ -400,7 +483,7 @@ class _SourceFactories:
         self,
         datasource_type: Type[Datasource],
         name_or_datasource: Optional[Union[str, Datasource]],
-        **kwargs,
+        kwargs: Dict[str, Any],
     ) -> Optional[Datasource]:
         """Validates the input is a datasource or a set of constructor parameters
 
@@ -410,6 +493,7 @@ class _SourceFactories:
         Args:
              datasource_type: The expected type of datasource
              name_or_datasource: Either the datasource or the name of the datasource.
+             kwargs: The keyword arguments passed to the crud method.
 
         Returns:
             The passed in datasource or None.
@@ -419,7 +503,7 @@ class _SourceFactories:
                         a datasource is not passed in and no name argument is present.
         """
         new_datasource = self._datasource_passed_in_as_only_argument(
-            datasource_type, name_or_datasource, **kwargs
+            datasource_type, name_or_datasource, kwargs
         )
         if new_datasource:
             return new_datasource
@@ -444,14 +528,15 @@ class _SourceFactories:
         ) -> Datasource:
             # Because of the precedence of `or` and `if`, these grouping paranthesis are necessary.
             datasource = (
-                self._datasource_passed_in(datasource_type, name_or_datasource, **kwargs)
+                self._datasource_passed_in(datasource_type, name_or_datasource, kwargs)
             ) or (
                 datasource_type(name=name_or_datasource, **kwargs)
                 if name_or_datasource
                 else datasource_type(**kwargs)
             )
-            logger.debug(f"Adding {datasource_type} with {datasource.name}")
-            datasource._data_context = self._data_context
+            logger.debug("Adding %s with %s", datasource_type, datasource.name)
+            # `_data_context` is a pydantic private attribute (a slot), skip `BaseModel.__setattr__`
+            object.__setattr__(datasource, "_data_context", self._data_context)
             datasource.test_connection()
             datasource = self._data_context._add_fluent_datasource(datasource)
 
@@ -462,7 +547,7 @@ class _SourceFactories:
         add_datasource.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
             add_datasource,
             datasource_type,
-            exclude={"type", "assets"},
+            exclude=_MERGE_EXCLUDE_DATASOURCE,
             return_type=datasource_type,
         )
         return add_datasource
@@ -472,14 +557,14 @@ class _SourceFactories:
         datasource_type: Type[Datasource],
         doc_string: str = "",
     ) -> SourceFactoryFn:
+        # circular import
+        from great_expectations.datasource.fluent.interfaces import Datasource
+
         def update_datasource(
             name_or_datasource: Optional[Union[str, Datasource]] = None, **kwargs
         ) -> Datasource:
-            # circular import
-            from great_expectations.datasource.fluent.interfaces import Datasource
-
             updated_datasource = (
-                self._datasource_passed_in(datasource_type, name_or_datasource, **kwargs)
+                self._datasource_passed_in(datasource_type, name_or_datasource, kwargs)
             ) or (
                 datasource_type(name=name_or_datasource, **kwargs)
                 if name_or_datasource
@@ -487,7 +572,7 @@ class _SourceFactories:
             )
 
             datasource_name: str = updated_datasource.name
-            logger.debug(f"Updating {datasource_type} with {datasource_name}")
+            logger.debug("Updating %s with %s", datasource_type, datasource_name)
             self._validate_current_datasource_type(
                 datasource_name,
                 datasource_type,
@@ -498,7 +583,7 @@ class _SourceFactories:
             if id_:
                 updated_datasource.id = id_
 
-            updated_datasource._data_context = self._data_context
+            object.__setattr__(updated_datasource, "_data_context", self._data_context)
             updated_datasource.test_connection()
             return_obj = self._data_context._update_fluent_datasource(datasource=updated_datasource)
             assert isinstance(return_obj, Datasource)
@@ -509,7 +594,7 @@ class _SourceFactories:
         update_datasource.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
             update_datasource,
             datasource_type,
-            exclude={"type", "assets"},
+            exclude=_MERGE_EXCLUDE_DATASOURCE,
             return_type=datasource_type,
         )
         return update_datasource
@@ -519,14 +604,14 @@ class _SourceFactories:
         datasource_type: Type[Datasource],
         doc_string: str = "",
     ) -> SourceFactoryFn:
+        # circular import
+        from great_expectations.datasource.fluent.interfaces import Datasource
+
         def add_or_update_datasource(
             name_or_datasource: Optional[Union[str, Datasource]] = None, **kwargs
         ) -> Datasource:
-            # circular import
-            from great_expectations.datasource.fluent.interfaces import Datasource
-
             new_datasource = (
-                self._datasource_passed_in(datasource_type, name_or_datasource, **kwargs)
+                self._datasource_passed_in(datasource_type, name_or_datasource, kwargs)
             ) or (
                 datasource_type(name=name_or_datasource, **kwargs)
                 if name_or_datasource
@@ -535,7 +620,9 @@ class _SourceFactories:
 
             # if new_datasource is None that means name is defined as name_or_datasource or as a kwarg  # noqa: E501
             datasource_name: str = new_datasource.name
-            logger.debug(f"Adding or updating {datasource_type.__name__} with '{datasource_name}'")
+            logger.debug(
+                "Adding or updating %s with '%s'", datasource_type.__name__, datasource_name
+            )
             self._validate_current_datasource_type(
                 datasource_name, datasource_type, raise_if_none=False
             )
@@ -545,7 +632,7 @@ class _SourceFactories:
             if id_:
                 new_datasource.id = id_
 
-            new_datasource._data_context = self._data_context
+            object.__setattr__(new_datasource, "_data_context", self._data_context)
             new_datasource.test_connection()
             if datasource_name in self.all():
                 return_obj = self._data_context._update_fluent_datasource(datasource=new_datasource)
@@ -559,7 +646,7 @@ class _SourceFactories:
         add_or_update_datasource.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
             add_or_update_datasource,
             datasource_type,
-            exclude={"type", "assets"},
+            exclude=_MERGE_EXCLUDE_DATASOURCE,
             return_type=datasource_type,
         )
         return add_or_update_datasource
@@ -570,7 +657,7 @@ class _SourceFactories:
         doc_string: str = "",
     ) -> Callable[[str], None]:
         def delete_datasource(name: str) -> None:
-            logger.debug(f"Delete {datasource_type} with {name}")
+            logger.debug("Delete %s with %s", datasource_type, name)
             self._validate_current_datasource_type(name, datasource_type)
             self._data_context._delete_fluent_datasource(datasource_name=name)
             self._data_context._save_project_config()
@@ -599,33 +686,43 @@ class _SourceFactories:
 
     def __getattr__(self, attr_name: str):
         try:
-            crud_method_info = self.__crud_registry[attr_name]
-            crud_method_type, datasource_type = crud_method_info()
-            docstring = crud_method_info.__doc__ or ""
-            if crud_method_type == CrudMethodType.ADD:
-                return self.create_add_crud_method(datasource_type, docstring)
-            elif crud_method_type == CrudMethodType.UPDATE:
-                return self.create_update_crud_method(datasource_type, docstring)
-            elif crud_method_type == CrudMethodType.ADD_OR_UPDATE:
-                return self.create_add_or_update_crud_method(datasource_type, docstring)
-            elif crud_method_type == CrudMethodType.DELETE:
-                # deprecated-v0.17.2
-                warnings.warn(
-                    f"`{attr_name}` is deprecated as of v0.17.2 and will be removed in v0.19. Please use `.sources.delete` moving forward.",  # noqa: E501
-                    DeprecationWarning,
-                )
-                return self.create_delete_crud_method(datasource_type, docstring)
-            else:
-                raise TypeRegistrationError(  # noqa: TRY003
-                    f"Unknown crud method registered for {attr_name} with type {crud_method_type}"
-                )
+            crud_method_info = _CRUD_REGISTRY[attr_name]
         except KeyError as e:
             raise AttributeError(f"No crud method '{attr_name}' in {self.factories}") from e  # noqa: TRY003
 
+        crud_method_type, datasource_type = crud_method_info()
+        if crud_method_type == CrudMethodType.DELETE:
+            # deprecated-v0.17.2
+            warnings.warn(
+                f"`{attr_name}` is deprecated as of v0.17.2 and will be removed in v0.19. Please use `.sources.delete` moving forward.",  # noqa: E501
+                DeprecationWarning,
+            )
+
+        cached = self._crud_method_cache.get(attr_name)
+        if cached and cached[0] is crud_method_info:
+            return cached[1]
+
+        docstring = crud_method_info.__doc__ or ""
+        crud_method: Callable
+        if crud_method_type == CrudMethodType.ADD:
+            crud_method = self.create_add_crud_method(datasource_type, docstring)
+        elif crud_method_type == CrudMethodType.UPDATE:
+            crud_method = self.create_update_crud_method(datasource_type, docstring)
+        elif crud_method_type == CrudMethodType.ADD_OR_UPDATE:
+            crud_method = self.create_add_or_update_crud_method(datasource_type, docstring)
+        elif crud_method_type == CrudMethodType.DELETE:
+            crud_method = self.create_delete_crud_method(datasource_type, docstring)
+        else:
+            raise TypeRegistrationError(  # noqa: TRY003
+                f"Unknown crud method registered for {attr_name} with type {crud_method_type}"
+            )
+        self._crud_method_cache[attr_name] = (crud_method_info, crud_method)
+        return crud_method
+
     @override
     def __dir__(self) -> List[str]:
         """Preserves autocompletion for dynamic attributes."""
-        return [*self.factories, *super().__dir__()]
+        return [*self._factory_names(), *super().__dir__()]
 
 
 def _iter_all_registered_types(
@@ -635,12 +732,30 @@ def _iter_all_registered_types(
     Iterate through all registered Datasource and DataAsset types.
     Returns tuples of the registered type name and the actual type/class.
     """
-    for ds_name in _SourceFactories.type_lookup.type_names():
-        ds_type: Type[Datasource] = _SourceFactories.type_lookup[ds_name]
-        if include_datasource:
-            yield ds_name, ds_type
-
-        if include_data_asset:
-            for asset_name in ds_type._type_lookup.type_names():
-                asset_type: Type[DataAsset] = ds_type._type_lookup[asset_name]
-                yield asset_name, asset_type
+    ds_type_lookup: TypeLookup = _SourceFactories.type_lookup
+    ds_type: Type[Datasource]
+    # `TypeLookup` rebuilds its `type_names()` tuple on any change, so the cached entries are
+    # current as long as every lookup they were built from still returns the same tuple
+    lookup_names = [ds_type_lookup.type_names()]
+    for _, ds_type in ds_type_lookup.named_types():  # type: ignore[assignment] # names map to types
+        lookup_names.append(ds_type._type_lookup.type_names())
+    cached = _SourceFactories._all_types_cache
+    if (
+        cached
+        and len(cached[0]) == len(lookup_names)
+        and all(old is new for old, new in zip(cached[0], lookup_names))
+    ):
+        all_types = cached[1]
+    else:
+        all_types = []
+        asset_type: Type[DataAsset]
+        for ds_name, ds_type in ds_type_lookup.named_types():  # type: ignore[assignment] # names map to types
+            all_types.append((ds_name, ds_type, True))
+
+            for asset_name, asset_type in ds_type._type_lookup.named_types():  # type: ignore[assignment] # names map to types
+                all_types.append((asset_name, asset_type, False))
+        _SourceFactories._all_types_cache = (lookup_names, all_types)
+
+    for name, type_, is_datasource in all_types:
+        if include_datasource if is_datasource else include_data_asset:
+            yield name, type_
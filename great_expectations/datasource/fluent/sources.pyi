@@ -1,15 +1,17 @@
 import pathlib
 import uuid
+from enum import Enum
 from logging import Logger
 from typing import (
     Any,
     Callable,
     ClassVar,
+    Dict,
     Final,
     Generator,
     List,
-    NamedTuple,
     Optional,
+    Tuple,
     Type,
     Union,
     overload,
@@ -58,6 +60,7 @@ from great_expectations.datasource.fluent.sqlite_datasource import SqliteDsn
 from great_expectations.datasource.fluent.type_lookup import TypeLookup
 
 SourceFactoryFn: TypeAlias = Callable[..., Datasource]
+CrudMethodInfoFn: TypeAlias = Callable[..., Tuple[CrudMethodType, Type[Datasource]]]
 logger: Logger
 DEFAULT_PANDAS_DATASOURCE_NAME: Final[str]
 DEFAULT_PANDAS_DATA_ASSET_NAME: Final[str]
@@ -65,20 +68,37 @@ DEFAULT_PANDAS_DATA_ASSET_NAME: Final[str]
 class DefaultPandasDatasourceError(Exception): ...
 class TypeRegistrationError(TypeError): ...
 
-class _FieldDetails(NamedTuple):
-    default_value: Any
-    type_annotation: Type
+class CrudMethodType(str, Enum):
+    ADD = "ADD"
+    DELETE = "DELETE"
+    UPDATE = "UPDATE"
+    ADD_OR_UPDATE = "ADD_OR_UPDATE"
 
-def _get_field_details(model: Type[pydantic.BaseModel], field_name: str) -> _FieldDetails: ...
+_CRUD_REGISTRY: Dict[str, CrudMethodInfoFn]
+
+def _get_field_details(model: Type[pydantic.BaseModel], field_name: str) -> Tuple[Any, Type]: ...
 
 class _SourceFactories:
     type_lookup: ClassVar[TypeLookup]
+    _all_types_cache: ClassVar[
+        Optional[
+            Tuple[
+                List[Tuple[str, ...]],
+                List[Tuple[str, Union[Type[Datasource], Type[DataAsset]], bool]],
+            ]
+        ]
+    ]
+    _factories_cache: ClassVar[Optional[Tuple[str, ...]]]
     def __init__(self, data_context: GXDataContext) -> None: ...
     @classmethod
     def register_datasource(
         cls,
         ds_type: Type[Datasource],
     ) -> None: ...
+    @classmethod
+    def _resolve_asset_types(
+        cls, ds_type: Type[Datasource]
+    ) -> Tuple[Tuple[Type[DataAsset], str], ...]: ...
     @property
     def pandas_default(self) -> PandasDatasource: ...
     @property
@@ -12,6 +12,7 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    Tuple,
     Type,
     Union,
     overload,
@@ -47,6 +48,10 @@ class TypeLookup(
     Once set, values/keys cannot be overwritten.
     """
 
+    # parallel `str` names and the values they map to, built on demand and reset on any change
+    _names: Optional[Tuple[str, ...]] = None
+    _values: Optional[Tuple[ValidTypes, ...]] = None
+
     def __init__(
         self,
         __dict: Optional[Mapping[ValidTypes, ValidTypes]] = None,
@@ -55,12 +60,28 @@ class TypeLookup(
         __dict = __dict or {}
         super().__init__(__dict, **kwargs)
 
-    def type_names(self) -> Generator[str, None, None]:
-        """Yields only the type `str` names of the TypeLookup."""
-        for k in self:
-            if isinstance(k, str):
-                yield k
-            continue
+    def type_names(self) -> Tuple[str, ...]:
+        """Returns only the type `str` names of the TypeLookup."""
+        if self._names is None:
+            self._build_names()
+        assert self._names is not None
+        return self._names
+
+    def named_types(self) -> Iterable[Tuple[str, ValidTypes]]:
+        """Returns `(name, type)` pairs for each of the type `str` names of the TypeLookup."""
+        if self._names is None or self._values is None:
+            self._build_names()
+        assert self._names is not None and self._values is not None
+        return zip(self._names, self._values)
+
+    def _build_names(self) -> None:
+        names = tuple(k for k in self.data if isinstance(k, str))
+        self._names = names
+        self._values = tuple(self.data[name] for name in names)
+
+    def _reset_names(self) -> None:
+        self._names = None
+        self._values = None
 
     @overload
     def __getitem__(self, key: str) -> Type: ...
@@ -82,6 +103,7 @@ class TypeLookup(
     def __delitem__(self, key: ValidTypes):
         value = self.data.pop(key)
         super().pop(value, None)
+        self._reset_names()
 
     @override
     def __setitem__(self, key: ValidTypes, value: ValidTypes):
@@ -98,6 +120,7 @@ class TypeLookup(
             raise TypeLookupError(f"`{value}` already set - bad value")  # noqa: TRY003
         super().__setitem__(key, value)
         super().__setitem__(value, key)
+        self._reset_names()
 
     @override
     def __repr__(self) -> str:
@@ -123,6 +146,7 @@ class TypeLookup(
     @override
     def clear(self) -> None:
         """Clear all data. Deletes all keys and values."""
+        self._reset_names()
         return self.data.clear()
 
     @contextlib.contextmanager
@@ -159,6 +183,7 @@ class TypeLookup(
             if txn_exc:
                 logger.debug("Transaction of items rolled back")
                 self.data = backup_data
+                self._reset_names()
             else:
                 logger.debug("Transaction committing items")
             logger.debug("Completed TypeLookup transaction")
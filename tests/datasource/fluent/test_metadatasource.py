@@ -30,9 +30,13 @@ from great_expectations.datasource.fluent.interfaces import (
 )
 from great_expectations.datasource.fluent.metadatasource import MetaDatasource
 from great_expectations.datasource.fluent.sources import (
+    _CRUD_REGISTRY,
     TypeRegistrationError,
+    _get_field_details,
+    _iter_all_registered_types,
     _SourceFactories,
 )
+from great_expectations.datasource.fluent.type_lookup import TypeLookupError
 from great_expectations.execution_engine import ExecutionEngine
 
 yaml = YAMLHandler()
@@ -134,7 +138,7 @@ def context_sources_cleanup() -> Generator[_SourceFactories, None, None]:
     """Return the sources object and reset types/factories on teardown"""
     try:
         # setup
-        sources_copy = copy.deepcopy(_SourceFactories._SourceFactories__crud_registry)  # type: ignore[attr-defined]
+        sources_copy = copy.deepcopy(_CRUD_REGISTRY)
         type_lookup_copy = copy.deepcopy(_SourceFactories.type_lookup)
         sources = get_context().data_sources
 
@@ -144,14 +148,17 @@ def context_sources_cleanup() -> Generator[_SourceFactories, None, None]:
 
         yield sources
     finally:
-        _SourceFactories._SourceFactories__crud_registry = sources_copy  # type: ignore[attr-defined]
+        _CRUD_REGISTRY.clear()
+        _CRUD_REGISTRY.update(sources_copy)
         _SourceFactories.type_lookup = type_lookup_copy
+        _SourceFactories._factories_cache = None
 
 
 @pytest.fixture(scope="function")
 def empty_sources(context_sources_cleanup) -> Generator[_SourceFactories, None, None]:
-    _SourceFactories._SourceFactories__crud_registry.clear()  # type: ignore[attr-defined]
+    _CRUD_REGISTRY.clear()
     _SourceFactories.type_lookup.clear()
+    _SourceFactories._factories_cache = None
     assert not _SourceFactories.type_lookup
     yield context_sources_cleanup
 
@@ -324,6 +331,61 @@ class TestMisconfiguredMetaDatasource:
         # check that no types were registered
         assert len(empty_sources.type_lookup) < 1
 
+    def test_ds_type_name_already_registered(self, empty_sources: _SourceFactories):
+        class FirstDatasource(Datasource):
+            type: str = "duplicate"
+
+            @property
+            @override
+            def execution_engine_type(self) -> Type[ExecutionEngine]:
+                return DummyExecutionEngine
+
+            @override
+            def test_connection(self) -> None: ...  # type: ignore[override]
+
+        registered_types = dict(empty_sources.type_lookup)
+
+        # same error (a `ValueError`) that setting the name on the `TypeLookup` would raise
+        with pytest.raises(TypeLookupError, match=r"Items are already present - {'duplicate'}"):
+
+            class SecondDatasource(Datasource):
+                type: str = "duplicate"
+
+                @property
+                @override
+                def execution_engine_type(self) -> Type[ExecutionEngine]:
+                    return DummyExecutionEngine
+
+                @override
+                def test_connection(self) -> None: ...  # type: ignore[override]
+
+        assert dict(empty_sources.type_lookup) == registered_types
+        assert empty_sources.type_lookup["duplicate"] is FirstDatasource
+
+    def test_ds_type_already_registered(self, empty_sources: _SourceFactories):
+        class RegisteredDatasource(Datasource):
+            type: str = "registered"
+
+            @property
+            @override
+            def execution_engine_type(self) -> Type[ExecutionEngine]:
+                return DummyExecutionEngine
+
+            @override
+            def test_connection(self) -> None: ...  # type: ignore[override]
+
+        registered_types = dict(empty_sources.type_lookup)
+        factories = empty_sources.factories
+
+        with pytest.raises(
+            TypeRegistrationError,
+            match=r"'registered' is already a registered typed",
+        ):
+            _SourceFactories.register_datasource(RegisteredDatasource)
+
+        assert dict(empty_sources.type_lookup) == registered_types
+        assert empty_sources.factories == factories
+
     def test_ds_test_connection_not_defined(self, empty_sources: _SourceFactories):
         class MissingTestConnectionDatasource(Datasource):
             type: str = "valid"
@@ -623,5 +685,96 @@ def test_legacy_delete_datasource_raises_deprecation_warning(
         context.data_sources.delete_pandas_filesystem(name=DEFAULT_CRUD_DATASOURCE_NAME)
 
 
+@pytest.mark.unit
+def test_crud_methods_are_reused_across_attribute_access(
+    context_sources_cleanup: _SourceFactories,
+):
+    class ReusedDatasource(Datasource):
+        type: str = "reused"
+
+        @property
+        @override
+        def execution_engine_type(self) -> Type[ExecutionEngine]:
+            return DummyExecutionEngine
+
+    add_method = context_sources_cleanup.add_reused
+    assert context_sources_cleanup.add_reused is add_method
+    assert context_sources_cleanup.update_reused is not add_method
+
+    # the deprecation warning is raised on every access, not only when the method is built
+    for _ in range(2):
+        with pytest.deprecated_call():
+            context_sources_cleanup.delete_reused  # noqa: B018
+
+
+@pytest.mark.unit
+def test_crud_methods_attach_data_context(context_sources_cleanup: _SourceFactories):
+    class AttachedDatasource(Datasource):
+        type: str = "attached"
+
+        @property
+        @override
+        def execution_engine_type(self) -> Type[ExecutionEngine]:
+            return DummyExecutionEngine
+
+        @override
+        def test_connection(self) -> None: ...  # type: ignore[override]
+
+    datasource = context_sources_cleanup.add_attached(name="attached_ds")
+
+    assert datasource._data_context is context_sources_cleanup._data_context
+    # the private attribute is not mistaken for a model field
+    assert "_data_context" not in datasource.__dict__
+    assert "_data_context" not in datasource.dict()
+
+
+@pytest.mark.unit
+def test_iter_all_registered_types_picks_up_new_registrations(
+    context_sources_cleanup: _SourceFactories,
+):
+    registered_before = list(_iter_all_registered_types())
+    assert registered_before == list(_iter_all_registered_types())
+
+    class LateAsset(DummyDataAsset):
+        type: str = "late"
+
+    class LateDatasource(Datasource):
+        asset_types: ClassVar[List[Type[DataAsset]]] = [LateAsset]
+        type: str = "late_ds"
+
+        @property
+        @override
+        def execution_engine_type(self) -> Type[ExecutionEngine]:
+            return DummyExecutionEngine
+
+    registered_after = list(_iter_all_registered_types())
+    assert ("late_ds", LateDatasource) in registered_after
+    assert ("late", LateAsset) in registered_after
+    assert len(registered_after) == len(registered_before) + 2
+
+    assert ("late_ds", LateDatasource) not in _iter_all_registered_types(include_datasource=False)
+    assert ("late", LateAsset) not in _iter_all_registered_types(include_data_asset=False)
+
+
+@pytest.mark.unit
+def test_iter_all_registered_types_reflects_type_lookup_changes(
+    context_sources_cleanup: _SourceFactories,
+):
+    assert list(_iter_all_registered_types())
+
+    _SourceFactories.type_lookup.clear()
+    assert not list(_iter_all_registered_types())
+
+
+@pytest.mark.unit
+def test_get_field_details_is_memoized():
+    class CachedAsset(DummyDataAsset):
+        type: str = "cached"
+
+    field_details = _get_field_details(CachedAsset, "type")
+    assert field_details[0] == "cached"
+    assert _get_field_details(CachedAsset, "type") is field_details
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv", "--log-level=DEBUG"])
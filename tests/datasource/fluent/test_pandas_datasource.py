@@ -140,7 +140,7 @@ class TestDynamicPandasAssets:
 
     @pytest.mark.parametrize("asset_class", _DYNAMIC_ASSET_TYPES)
     def test_add_asset_method_exists_and_is_functional(self, asset_class: Type[_PandasDataAsset]):
-        type_name: str = _get_field_details(asset_class, "type").default_value
+        type_name, _ = _get_field_details(asset_class, "type")
         method_name: str = f"add_{type_name}_asset"
 
         print(f"{method_name}() -> {asset_class.__name__}")
@@ -170,7 +170,7 @@ class TestDynamicPandasAssets:
 
     @pytest.mark.parametrize("asset_class", _DYNAMIC_ASSET_TYPES)
     def test_add_asset_method_signature(self, asset_class: Type[_PandasDataAsset]):
-        type_name: str = _get_field_details(asset_class, "type").default_value
+        type_name, _ = _get_field_details(asset_class, "type")
         method_name: str = f"add_{type_name}_asset"
 
         ds = PandasDatasource(
@@ -416,6 +416,20 @@ def test_default_pandas_datasource_get_and_set(
             assert asset["name"] != DEFAULT_PANDAS_DATA_ASSET_NAME
 
 
+@pytest.mark.filesystem
+def test_default_pandas_datasource_is_recreated_after_delete(
+    empty_data_context: AbstractDataContext,
+):
+    pandas_datasource = empty_data_context.data_sources.pandas_default
+    empty_data_context.data_sources.delete(name=DEFAULT_PANDAS_DATASOURCE_NAME)
+    assert DEFAULT_PANDAS_DATASOURCE_NAME not in empty_data_context.data_sources.all()
+
+    # pandas_default must not hand back the deleted datasource
+    recreated_datasource = empty_data_context.data_sources.pandas_default
+    assert recreated_datasource is not pandas_datasource
+    assert DEFAULT_PANDAS_DATASOURCE_NAME in empty_data_context.data_sources.all()
+
+
 @pytest.mark.spark
 def test_default_pandas_datasource_name_conflict(
     empty_data_context: AbstractDataContext,
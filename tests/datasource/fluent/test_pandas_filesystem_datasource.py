@@ -145,7 +145,7 @@ class TestDynamicPandasAssets:
 
     @pytest.mark.parametrize("asset_class", PandasFilesystemDatasource.asset_types)
     def test_add_asset_method_exists_and_is_functional(self, asset_class: Type[PathDataAsset]):
-        type_name: str = _get_field_details(asset_class, "type").default_value
+        type_name, _ = _get_field_details(asset_class, "type")
         method_name: str = f"add_{type_name}_asset"
 
         print(f"{method_name}() -> {asset_class.__name__}")
@@ -169,7 +169,7 @@ class TestDynamicPandasAssets:
 
     @pytest.mark.parametrize("asset_class", PandasFilesystemDatasource.asset_types)
     def test_add_asset_method_signature(self, asset_class: Type[PathDataAsset]):
-        type_name: str = _get_field_details(asset_class, "type").default_value
+        type_name, _ = _get_field_details(asset_class, "type")
         method_name: str = f"add_{type_name}_asset"
 
         ds = PandasFilesystemDatasource(
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import inspect
+
+import pytest
+
+from great_expectations.datasource.fluent.signatures import (
+    _merge_signatures,
+)
+
+
+def _target(self, name: str, **kwargs) -> None: ...
+
+
+def _source(*, name: str, some_option: int = 1, type: str = "my_type") -> None: ...
+
+
+@pytest.mark.unit
+def test_merge_signatures_accepts_precomputed_source_signature():
+    expected = _merge_signatures(_target, _source, exclude={"type"})
+    assert _merge_signatures(_target, inspect.signature(_source), exclude={"type"}) == expected
+    assert list(expected.parameters) == ["self", "name", "some_option"]
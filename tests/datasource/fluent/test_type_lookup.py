@@ -97,6 +97,20 @@ def test_raise_if_contains_does_not_raise(collection_to_check: Iterable[ValidTyp
     type_lookup.raise_if_contains(collection_to_check)
 
 
+def test_type_names_and_named_types():
+    d = TypeLookup({"a_list": list, dict: "a_dict"})
+    assert d.type_names() == ("a_list", "a_dict")
+    assert list(d.named_types()) == [("a_list", list), ("a_dict", dict)]
+
+    d["a_set"] = set
+    assert d.type_names() == ("a_list", "a_dict", "a_set")
+
+    assert list(d.named_types())[-1] == ("a_set", set)
+
+    d.clear()
+    assert d.type_names() == ()
+
+
 class TestTransactions:
     def test_transaction_happy_path(self):
         t = TypeLookup({"a_list": list, "a_dict": dict})
@@ -138,6 +152,7 @@ class TestTransactions:
         # items added as part of transaction should not
         assert set not in t
         assert tuple not in t
+        assert t.type_names() == ("a_list", "a_dict")
 
 
 if __name__ == "__main__":